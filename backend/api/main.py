@@ -5,48 +5,104 @@ This is the entry point for the backend API server.
 It configures middleware, routes, and CORS for the application.
 """
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
 import asyncio
+import logging
 
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
+import orjson
+
+from .middleware import (
+    CORSASGIMiddleware,
+    ErrorHandlerMiddleware,
+    ETagMiddleware,
+    SingleFlightMiddleware,
+)
 from .routes import tasks
-from core.config import async_init_db
+from core.config import async_init_db, get_engine
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Application Lifespan
+# ============================================================================
+
+# Seconds startup waits for table creation before giving up on it
+DB_INIT_TIMEOUT = 5.0
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create database tables on startup and release pooled connections on shutdown.
+
+    A failed or slow table creation is logged rather than raised so that the
+    app still starts (and /health still answers) within DB_INIT_TIMEOUT when
+    the database is briefly unreachable, e.g. during a serverless cold start.
+    """
+    try:
+        await asyncio.wait_for(async_init_db(), timeout=DB_INIT_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Database initialization timed out after %ss, continuing without it",
+            DB_INIT_TIMEOUT,
+        )
+    except Exception as e:
+        logger.warning("Database initialization failed, continuing without it: %s", e)
+    yield
+    # Only dispose an engine that exists; calling get_engine() here would
+    # build one (and import the asyncpg dialect) just to throw it away
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="Todo API",
     description="RESTful API for managing todo tasks",
     version="2.0.0",
+    default_response_class=ORJSONResponse,  # orjson encodes datetimes natively in C
+    lifespan=lifespan,
 )
 
+# ============================================================================
+# Request Coalescing Middleware
+# ============================================================================
+
+# Identical concurrent GETs under /api/tasks share one execution. Sits inside
+# the ETag middleware so each caller still gets its own ETag header.
+app.add_middleware(SingleFlightMiddleware, path_prefix="/api/tasks")
+
+# ============================================================================
+# Conditional GET Middleware
+# ============================================================================
+
+# Answer polling GETs under /api/tasks with 304 when no write has happened
+# since the client's ETag was issued, without touching the database. Writes
+# are only seen by the process that handled them; with several workers a tag
+# can be stale for up to the middleware's ttl (5 s by default).
+app.add_middleware(ETagMiddleware, path_prefix="/api/tasks")
+
 # ============================================================================
 # CORS Middleware Configuration
 # ============================================================================
 
 # Configure CORS to allow frontend to make requests
 import os
+import re
 try:
-    origins = [
-        "http://localhost:5173",   # Vite dev server
-        "http://localhost:3000",   # Next.js dev server
-        "http://localhost:3001",   # Next.js dev server (alternate port)
-        "http://localhost:8000",   # Backend dev server (for testing)
-        "http://127.0.0.1:5173",   # Localhost IPv4 (Vite)
-        "http://127.0.0.1:3000",   # Localhost IPv4 (Next.js)
-        "http://127.0.0.1:3001",   # Localhost IPv4 (Next.js - alternate port)
-        "http://127.0.0.1:8000",   # Localhost IPv4 (Backend)
-    ]
+    # Local dev servers on any port: Vite (5173), Next.js (3000/3001), backend (8000)
+    origin_patterns = [r"http://(localhost|127\.0\.0\.1)(:\d+)?"]
+    origins = []
 
     # Add production domains when deployed to Vercel
     # Environment variable: VERCEL_URL or specific domain
     vercel_url = os.getenv("VERCEL_URL")
     if vercel_url:
-        origins.append(f"https://{vercel_url}")
-        origins.append(f"https://*.{vercel_url}")
-        # Also add www version
-        if not vercel_url.startswith("www."):
-            origins.append(f"https://www.{vercel_url}")
+        # The deployment itself and any subdomain of it (covers www.)
+        origin_patterns.append(rf"https://([\w-]+\.)?{re.escape(vercel_url)}")
         # Add with .com extension if it's a custom domain
         if not vercel_url.endswith(".com"):
             origins.append(f"https://{vercel_url}.com")
@@ -55,32 +111,64 @@ try:
     railway_domain = os.getenv("RAILWAY_PUBLIC_DOMAIN")
     if railway_domain:
         origins.append(f"https://{railway_domain}")
-        print(f"[CORS] Added Railway domain: https://{railway_domain}")
+        logger.info("CORS: added Railway domain https://%s", railway_domain)
 
-    # Allow all origins as a fallback for development
-    origins.append("*")
+    # Frontends hosted elsewhere: comma-separated list of exact origins
+    extra_origins = os.getenv("CORS_ORIGINS")
+    if extra_origins:
+        origins.extend(o.strip() for o in extra_origins.split(",") if o.strip())
 
     app.add_middleware(
-        CORSMiddleware,
+        CORSASGIMiddleware,
         allow_origins=origins,
+        allow_origin_regex="|".join(f"(?:{p})" for p in origin_patterns),
         allow_credentials=True,
         allow_methods=["*"],
-        allow_headers=["*"],
     )
-    print("[CORS] CORS middleware configured successfully")
+    logger.debug("CORS middleware configured")
 except Exception as e:
-    print(f"[CORS] WARNING: Failed to configure CORS: {e}")
+    logger.warning("Failed to configure CORS: %s", e)
 
 # ============================================================================
-# Include Routers
+# Mount API Sub-Application
 # ============================================================================
 
-app.include_router(tasks.router, prefix="/api", tags=["tasks"])
+# Task routes live in their own app mounted at /api. The mount is matched by
+# a single prefix check, so /, /test and /health never scan the task route
+# table. The sub-app also serves the docs advertised by the root endpoint at
+# /api/docs and /api/openapi.json.
+api_app = FastAPI(
+    title="Todo API",
+    description="RESTful API for managing todo tasks",
+    version="2.0.0",
+    default_response_class=ORJSONResponse,
+)
+api_app.include_router(tasks.router, tags=["tasks"])
+
+# Translate uncaught exceptions into JSON errors (ValueError -> 400,
+# KeyError -> 404, IntegrityError -> 409, anything else -> 500). Registered on
+# the sub-app so it runs inside the sub-app's own ServerErrorMiddleware, which
+# would otherwise answer 500 first; the outer CORS middleware still wraps it.
+api_app.add_middleware(ErrorHandlerMiddleware)
+
+app.mount("/api", api_app)
 
 # ============================================================================
 # Root Endpoint
 # ============================================================================
 
+# These endpoints return constant payloads, so encode them once at import
+# instead of on every request (/health is scraped by load balancers).
+ROOT_BODY = orjson.dumps({
+    "message": "Todo API v2.0",
+    "version": "2.0.0",
+    "docs": "/api/docs",
+    "openapi": "/api/openapi.json"
+})
+TEST_BODY = orjson.dumps({"status": "ok", "message": "API is working!"})
+HEALTH_BODY = orjson.dumps({"status": "healthy"})
+
+
 @app.get("/")
 async def root():
     """
@@ -89,12 +177,7 @@ async def root():
     Returns:
         JSON with API details and documentation link
     """
-    return {
-        "message": "Todo API v2.0",
-        "version": "2.0.0",
-        "docs": "/api/docs",
-        "openapi": "/api/openapi.json"
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 @app.get("/test")
@@ -105,7 +188,7 @@ async def test():
     Returns:
         Simple JSON response
     """
-    return {"status": "ok", "message": "API is working!"}
+    return Response(content=TEST_BODY, media_type="application/json")
 
 
 @app.get("/health")
@@ -116,35 +199,4 @@ async def health():
     Returns:
         JSON indicating API is healthy
     """
-    return {"status": "healthy"}
-
-
-# ============================================================================
-# Error Handlers
-# ============================================================================
-
-@app.exception_handler(ValueError)
-async def value_error_handler(request, exc):
-    """Handle ValueError exceptions."""
-    return JSONResponse(
-        status_code=400,
-        content={"detail": str(exc)},
-    )
-
-
-@app.exception_handler(KeyError)
-async def key_error_handler(request, exc):
-    """Handle KeyError exceptions."""
-    return JSONResponse(
-        status_code=404,
-        content={"detail": f"Not found: {str(exc)}"},
-    )
-
-
-# ============================================================================
-# Application Events (Disabled for Vercel Serverless)
-# ============================================================================
-
-# NOTE: Startup/shutdown events are disabled for serverless compatibility
-# Database initialization will happen on first request instead
-# See routes.py for lazy initialization pattern
+    return Response(content=HEALTH_BODY, media_type="application/json")
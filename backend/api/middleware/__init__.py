@@ -1,3 +1,21 @@
 """
 FastAPI middleware - CORS, error handling, etc.
+
+Exports:
+  - CORSASGIMiddleware: Pure-ASGI CORS handling
+  - ErrorHandlerMiddleware: Pure-ASGI exception-to-JSON translation
+  - ETagMiddleware: 304 short-circuit for unchanged task GETs
+  - SingleFlightMiddleware: Coalesces identical concurrent task GETs
 """
+
+from .cors import CORSASGIMiddleware
+from .errors import ErrorHandlerMiddleware
+from .etag import ETagMiddleware
+from .singleflight import SingleFlightMiddleware
+
+__all__ = [
+    'CORSASGIMiddleware',
+    'ErrorHandlerMiddleware',
+    'ETagMiddleware',
+    'SingleFlightMiddleware',
+]
@@ -0,0 +1,133 @@
+"""
+Pure-ASGI CORS middleware.
+
+Handles CORS preflight requests without entering the application and appends
+precomputed CORS headers to every other response from an allowed origin.
+The origin allowlist, origin regex and all header values are encoded/compiled
+once at construction time so the per-request path only works on bytes.
+"""
+
+import re
+from typing import Iterable, Optional
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+EMPTY_BODY = {"type": "http.response.body", "body": b""}
+
+
+class CORSASGIMiddleware:
+    """
+    Minimal CORS middleware operating directly on ASGI messages.
+
+    Args:
+        app: The wrapped ASGI application
+        allow_origins: Exact origins to allow. "*" allows any origin.
+        allow_origin_regex: Regex an origin must fully match to be allowed,
+            checked after the exact allowlist
+        allow_credentials: Whether to send Access-Control-Allow-Credentials
+        allow_methods: Methods advertised in preflight responses ("*" for all)
+        max_age: Seconds browsers may cache a preflight response
+    """
+
+    def __init__(
+        self,
+        app,
+        allow_origins: Iterable[str] = (),
+        allow_origin_regex: Optional[str] = None,
+        allow_credentials: bool = False,
+        allow_methods: Iterable[str] = ALL_METHODS,
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        allow_origins = list(allow_origins)
+        allow_methods = list(allow_methods)
+        if "*" in allow_methods:
+            allow_methods = list(ALL_METHODS)
+
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = frozenset(
+            origin.encode("latin-1") for origin in allow_origins if origin != "*"
+        )
+        self.allow_origin_regex = (
+            re.compile(allow_origin_regex.encode("latin-1")) if allow_origin_regex else None
+        )
+
+        # Headers added to every CORS response, encoded once
+        self.simple_headers = [(b"vary", b"Origin")]
+        if allow_credentials:
+            self.simple_headers.append((b"access-control-allow-credentials", b"true"))
+
+        self.preflight_headers = self.simple_headers + [
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+
+        # Complete rejection response for preflights from unknown origins
+        rejected_body = b"Disallowed CORS origin"
+        self.rejected_preflight_headers = self.preflight_headers + [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(rejected_body)).encode("latin-1")),
+        ]
+        self.rejected_preflight_body = {"type": "http.response.body", "body": rejected_body}
+
+    def is_allowed_origin(self, origin: bytes) -> bool:
+        """Check whether the given Origin header value is allowed."""
+        if self.allow_all_origins or origin in self.allow_origins:
+            return True
+        if self.allow_origin_regex is None:
+            return False
+        return self.allow_origin_regex.fullmatch(origin) is not None
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self.preflight_response(origin, request_headers, send)
+            return
+
+        if not self.is_allowed_origin(origin):
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin)] + self.simple_headers
+
+        async def send_with_cors(message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def preflight_response(self, origin: bytes, request_headers, send) -> None:
+        """Answer a CORS preflight request directly with 204 No Content."""
+        if not self.is_allowed_origin(origin):
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": self.rejected_preflight_headers,
+            })
+            await send(self.rejected_preflight_body)
+            return
+
+        headers = [(b"access-control-allow-origin", origin)] + self.preflight_headers
+        if request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send(EMPTY_BODY)
@@ -0,0 +1,82 @@
+"""
+Pure-ASGI error handling middleware.
+
+Translates every uncaught exception raised by the application into a JSON
+error response without going through Starlette's exception handler
+machinery. Route handlers therefore don't need their own try/except blocks;
+they raise and this middleware picks the status code.
+"""
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+
+
+class ErrorHandlerMiddleware:
+    """
+    Convert uncaught exceptions into JSON error responses.
+
+    - pydantic ValidationError -> 500 {"detail": "<message>"} (a response or
+      row failed validation; request bodies are checked by FastAPI with 422)
+    - ValueError -> 400 {"detail": "<message>"}
+    - KeyError -> 404 {"detail": "Not found: <key>"}
+    - IntegrityError -> 409 {"detail": "<message>"}
+    - Any other Exception -> 500 {"detail": "<message>"}
+
+    If the response has already started, the exception is re-raised since
+    the status line can no longer be changed.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except ValidationError as exc:
+            # Subclasses ValueError, but is the server's fault, not the client's
+            if response_started:
+                raise
+            await send_json_error(send, 500, str(exc))
+        except ValueError as exc:
+            if response_started:
+                raise
+            await send_json_error(send, 400, str(exc))
+        except KeyError as exc:
+            if response_started:
+                raise
+            await send_json_error(send, 404, f"Not found: {str(exc)}")
+        except IntegrityError as exc:
+            if response_started:
+                raise
+            await send_json_error(send, 409, str(exc.orig))
+        except Exception as exc:
+            if response_started:
+                raise
+            await send_json_error(send, 500, str(exc))
+
+
+async def send_json_error(send, status: int, detail: str) -> None:
+    """Send a complete JSON error response with the given status and detail."""
+    body = orjson.dumps({"detail": detail})
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
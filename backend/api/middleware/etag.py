@@ -0,0 +1,107 @@
+"""
+Pure-ASGI ETag middleware for the task endpoints.
+
+Keeps an in-process version counter that is bumped whenever a mutating
+request (POST/PUT/PATCH/DELETE) to /api/tasks succeeds. GET responses under
+/api/tasks are tagged with a weak ETag derived from that counter and the
+request path/query, and a GET whose If-None-Match matches the current tag is
+answered with 304 before the application (and the database) is reached.
+
+The counter lives in process memory, so it only sees writes handled by the
+same process: the tags are exact for a single-instance, single-worker
+deployment. The ETag embeds a per-process boot ID so that tags issued by a
+different process (or before a restart) never match. With several workers or
+instances, a write handled elsewhere does not bump this process's counter, so
+each tag also carries a time bucket of ttl seconds; a client can be served a
+stale 304 for at most that long after another process's write.
+"""
+
+import os
+import time
+import zlib
+
+MUTATING_METHODS = frozenset(("POST", "PUT", "PATCH", "DELETE"))
+
+# Seconds an ETag stays valid when no local write has bumped the version
+DEFAULT_TTL = 5.0
+
+_boot_id = os.urandom(4).hex()
+_version = 0
+
+
+def current_version() -> int:
+    """Return the current task data version."""
+    return _version
+
+
+def bump_version() -> None:
+    """Invalidate every ETag issued so far."""
+    global _version
+    _version += 1
+
+
+def make_etag(path: str, query_string: bytes, ttl: float = DEFAULT_TTL) -> bytes:
+    """Build the weak ETag for a GET of path?query at the current version and time."""
+    key = zlib.crc32(path.encode("utf-8") + b"?" + query_string)
+    bucket = int(time.monotonic() // ttl)
+    return f'W/"{_boot_id}-v{_version}-t{bucket}-{key:08x}"'.encode("latin-1")
+
+
+class ETagMiddleware:
+    """
+    Answer unchanged GETs under a path prefix with 304 Not Modified.
+
+    Args:
+        app: The wrapped ASGI application
+        path_prefix: Only requests whose path starts with this prefix are handled
+        ttl: Seconds after which a tag expires even without a local write,
+            bounding staleness when other processes also write
+    """
+
+    def __init__(
+        self, app, path_prefix: str = "/api/tasks", ttl: float = DEFAULT_TTL
+    ) -> None:
+        self.app = app
+        self.path_prefix = path_prefix
+        self.ttl = ttl
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+
+        if method in MUTATING_METHODS:
+            async def send_and_invalidate(message) -> None:
+                if message["type"] == "http.response.start" and message["status"] < 400:
+                    bump_version()
+                await send(message)
+
+            await self.app(scope, receive, send_and_invalidate)
+            return
+
+        if method != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        etag = make_etag(scope["path"], scope["query_string"], self.ttl)
+
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if etag in (tag.strip() for tag in value.split(b",")):
+                    await send({
+                        "type": "http.response.start",
+                        "status": 304,
+                        "headers": [(b"etag", etag)],
+                    })
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+                break
+
+        async def send_with_etag(message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                message["headers"] = list(message.get("headers", ())) + [(b"etag", etag)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
@@ -0,0 +1,77 @@
+"""
+Pure-ASGI request coalescing ("single flight") middleware.
+
+When several identical GET requests are in flight at once, only the first
+(the leader) is passed to the application. The others wait for the leader
+to finish and replay the exact response messages it sent, so N concurrent
+page loads cost one database query instead of N.
+"""
+
+import asyncio
+
+from .etag import current_version
+
+
+class SingleFlightMiddleware:
+    """
+    Coalesce identical concurrent GETs under a path prefix.
+
+    Requests are identical when they share path, query string, Authorization
+    header and task data version. Including the version means a request that
+    arrives after a successful write never joins a flight started before it.
+
+    Args:
+        app: The wrapped ASGI application
+        path_prefix: Only GETs whose path starts with this prefix are coalesced
+    """
+
+    def __init__(self, app, path_prefix: str = "/api/tasks") -> None:
+        self.app = app
+        self.path_prefix = path_prefix
+        self.in_flight = {}
+
+    async def __call__(self, scope, receive, send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.path_prefix)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+                break
+        key = (scope["path"], scope["query_string"], authorization, current_version())
+
+        leader = self.in_flight.get(key)
+        if leader is not None:
+            messages = await asyncio.shield(leader)
+            if messages is None:
+                # Leader failed or was cancelled; serve this request ourselves
+                await self.app(scope, receive, send)
+                return
+            for message in messages:
+                await send(dict(message))
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        messages = []
+
+        async def send_and_record(message) -> None:
+            # Copy before sending: outer middleware may rewrite the headers
+            messages.append(dict(message))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_and_record)
+        except BaseException:
+            future.set_result(None)
+            raise
+        else:
+            future.set_result(messages)
+        finally:
+            del self.in_flight[key]
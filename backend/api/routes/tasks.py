@@ -12,13 +12,19 @@ This module defines all API routes for task operations using SQLModel and Postgr
 - GET /api/tasks/stats - Get task statistics
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Response
+from pydantic import TypeAdapter
 from typing import Optional
+from datetime import datetime
+import time
+from sqlalchemy import insert, update, delete
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select, func
 
-from core.models.task import Task
-from core.config import get_session
+from core.models.task import Task, validate_title
+from core.config import get_session, get_sessionmaker
+from core.services.async_batcher import AsyncBatcher
 from api.schemas.task_schema import (
     TaskCreate,
     TaskUpdate,
@@ -29,6 +35,110 @@ from api.schemas.task_schema import (
 # Create router
 router = APIRouter(tags=["tasks"])
 
+# Built once so responses are validated and encoded straight to JSON bytes by
+# pydantic-core, skipping FastAPI's response_model re-validation and
+# jsonable_encoder pass. The list adapter handles all rows in a single call.
+task_adapter = TypeAdapter(TaskResponse)
+task_list_adapter = TypeAdapter(list[TaskResponse])
+
+# Encoded /tasks/stats body and the monotonic time it was computed. The UI
+# polls stats for badge counts, so serve it from memory for a short TTL and
+# drop it whenever a write changes the counts.
+STATS_TTL = 2.0
+_stats_cache: Optional[tuple[float, bytes]] = None
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _invalidate_stats() -> None:
+    """Drop the cached stats body after a write that changes task counts."""
+    global _stats_cache
+    _stats_cache = None
+
+
+def _task_response(task: Task, status_code: int = 200) -> Response:
+    """Encode a single task as a JSON response."""
+    body = task_adapter.dump_json(task_adapter.validate_python(task, from_attributes=True))
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+async def _update_returning(
+    session: AsyncSession, task_id: int, values: dict
+) -> Optional[Task]:
+    """
+    Apply an UPDATE to a single task and return the updated row.
+
+    Uses UPDATE ... RETURNING so the write and the read-back happen in one
+    round-trip instead of get + commit + refresh.
+
+    Returns:
+        The updated Task, or None if no task has the given ID
+    """
+    statement = (
+        update(Task)
+        .where(Task.id == task_id)
+        .values(**values)
+        .returning(Task)
+        .execution_options(synchronize_session=False)
+    )
+    result = await session.execute(statement)
+    return result.scalar_one_or_none()
+
+
+# ============================================================================
+# Write Batching
+# ============================================================================
+
+async def _insert_batch(tasks: list[Task]) -> list[Task]:
+    """
+    Insert a batch of new tasks with a single multi-row INSERT ... RETURNING.
+
+    Returns:
+        The inserted rows, in the same order as the given tasks
+    """
+    statement = insert(Task).returning(Task, sort_by_parameter_order=True)
+    rows = [task.model_dump(exclude={"id"}) for task in tasks]
+    async with get_sessionmaker()() as session:
+        result = await session.scalars(statement, rows)
+        inserted = result.all()
+        await session.commit()
+    return inserted
+
+
+def _set_status_batch(status: str):
+    """Build a batch function that sets the given status on many task IDs."""
+    async def run_batch(task_ids: list[int]) -> list[Optional[Task]]:
+        # Like Task.mark_complete(), keep the first completion time so a
+        # retried PATCH doesn't move it
+        if status == "complete":
+            completed_at = func.coalesce(Task.completed_at, datetime.utcnow())
+        else:
+            completed_at = None
+        statement = (
+            update(Task)
+            .where(Task.id.in_(task_ids))
+            .values(status=status, completed_at=completed_at)
+            .returning(Task)
+            .execution_options(synchronize_session=False)
+        )
+        async with get_sessionmaker()() as session:
+            result = await session.execute(statement)
+            updated = {task.id: task for task in result.scalars()}
+            await session.commit()
+        return [updated.get(task_id) for task_id in task_ids]
+
+    return run_batch
+
+
+# Concurrent creates and status toggles arriving within a few milliseconds
+# share one statement and one commit. A batch failing on one bad row is
+# retried row by row so only that row's caller gets the error.
+create_batcher = AsyncBatcher(_insert_batch, split_on=(IntegrityError, DataError))
+complete_batcher = AsyncBatcher(_set_status_batch("complete"))
+incomplete_batcher = AsyncBatcher(_set_status_batch("pending"))
+
 
 # ============================================================================
 # API Endpoints
@@ -42,26 +152,22 @@ async def get_stats(session: AsyncSession = Depends(get_session)):
     Returns:
         TaskStats object with total, pending, and completed counts
     """
-    try:
-        # Get total count
-        total_result = await session.execute(select(func.count(Task.id)))
-        total = total_result.scalar() or 0
-
-        # Get pending count
-        pending_result = await session.execute(
-            select(func.count(Task.id)).where(Task.status == "pending")
-        )
-        pending = pending_result.scalar() or 0
+    global _stats_cache
+    cached = _stats_cache
+    if cached is not None and time.monotonic() - cached[0] < STATS_TTL:
+        return Response(content=cached[1], media_type="application/json")
 
-        # Get completed count
-        completed_result = await session.execute(
-            select(func.count(Task.id)).where(Task.status == "complete")
-        )
-        completed = completed_result.scalar() or 0
+    # Count all three buckets in a single round-trip
+    statement = select(
+        func.count(Task.id).label("total"),
+        func.count(Task.id).filter(Task.status == "pending").label("pending"),
+        func.count(Task.id).filter(Task.status == "complete").label("completed"),
+    )
+    row = (await session.execute(statement)).one()
 
-        return TaskStats(total=total, pending=pending, completed=completed)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving stats: {str(e)}")
+    body = TaskStats(**row._mapping).model_dump_json().encode()
+    _stats_cache = (time.monotonic(), body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/tasks", response_model=list[TaskResponse])
@@ -78,21 +184,21 @@ async def get_all_tasks(
     Returns:
         List of TaskResponse objects
     """
-    try:
-        statement = select(Task).order_by(Task.created_at.desc())
+    statement = select(Task).order_by(Task.created_at.desc())
 
-        if status:
-            statement = statement.where(Task.status == status)
+    if status:
+        statement = statement.where(Task.status == status)
 
-        result = await session.execute(statement)
-        tasks = result.scalars().all()
-        return [TaskResponse.model_validate(task, from_attributes=True) for task in tasks]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving tasks: {str(e)}")
+    result = await session.execute(statement)
+    tasks = result.scalars().all()
+    body = task_list_adapter.dump_json(
+        task_list_adapter.validate_python(tasks, from_attributes=True)
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/tasks", response_model=TaskResponse, status_code=201)
-async def create_task(task_data: TaskCreate, session: AsyncSession = Depends(get_session)):
+async def create_task(task_data: TaskCreate):
     """
     Create a new task.
 
@@ -102,21 +208,17 @@ async def create_task(task_data: TaskCreate, session: AsyncSession = Depends(get
 
     Returns:
         Created TaskResponse object
-    """
-    try:
-        if not task_data.title or not task_data.title.strip():
-            raise ValueError("Task title cannot be empty")
 
-        task = Task(title=task_data.title, description=task_data.description)
-        session.add(task)
-        await session.commit()
-        await session.refresh(task)
-        return TaskResponse.model_validate(task, from_attributes=True)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error creating task: {str(e)}")
+    Raises:
+        400: If title is invalid
+    """
+    # Raises ValueError (400) for a blank title
+    task = Task(title=task_data.title, description=task_data.description)
+    # The batched INSERT returns the generated id and expire_on_commit=False
+    # keeps the loaded attributes, so no refresh SELECT is needed.
+    task = await create_batcher.submit(task)
+    _invalidate_stats()
+    return _task_response(task, status_code=201)
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
@@ -133,15 +235,10 @@ async def get_task(task_id: int, session: AsyncSession = Depends(get_session)):
     Raises:
         404: If task not found
     """
-    try:
-        task = await session.get(Task, task_id)
-        if not task:
-            raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
-        return TaskResponse.model_validate(task, from_attributes=True)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving task: {str(e)}")
+    task = await session.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
+    return _task_response(task)
 
 
 @router.put("/tasks/{task_id}", response_model=TaskResponse)
@@ -165,31 +262,22 @@ async def update_task(
         404: If task not found
         400: If title is invalid
     """
-    try:
-        task = await session.get(Task, task_id)
-        if not task:
-            raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
+    values = {}
+    if task_data.title is not None:
+        values["title"] = validate_title(task_data.title)
 
-        if task_data.title is not None:
-            if not task_data.title.strip():
-                raise ValueError("Task title cannot be empty")
-            task.title = task_data.title
+    if task_data.description is not None:
+        values["description"] = task_data.description
 
-        if task_data.description is not None:
-            task.description = task_data.description
+    if values:
+        task = await _update_returning(session, task_id, values)
+    else:
+        task = await session.get(Task, task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
 
-        session.add(task)
-        await session.commit()
-        await session.refresh(task)
-        return TaskResponse.model_validate(task, from_attributes=True)
-    except ValueError as e:
-        await session.rollback()
-        raise HTTPException(status_code=400, detail=str(e))
-    except HTTPException:
-        raise
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error updating task: {str(e)}")
+    await session.commit()
+    return _task_response(task)
 
 
 @router.delete("/tasks/{task_id}", status_code=204)
@@ -203,23 +291,19 @@ async def delete_task(task_id: int, session: AsyncSession = Depends(get_session)
     Raises:
         404: If task not found
     """
-    try:
-        task = await session.get(Task, task_id)
-        if not task:
-            raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
+    result = await session.execute(
+        delete(Task).where(Task.id == task_id).returning(Task.id)
+    )
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
 
-        session.delete(task)
-        await session.commit()
-        return None
-    except HTTPException:
-        raise
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error deleting task: {str(e)}")
+    await session.commit()
+    _invalidate_stats()
+    return None
 
 
 @router.patch("/tasks/{task_id}/complete", response_model=TaskResponse)
-async def mark_complete(task_id: int, session: AsyncSession = Depends(get_session)):
+async def mark_complete(task_id: int):
     """
     Mark a task as complete.
 
@@ -232,25 +316,16 @@ async def mark_complete(task_id: int, session: AsyncSession = Depends(get_sessio
     Raises:
         404: If task not found
     """
-    try:
-        task = await session.get(Task, task_id)
-        if not task:
-            raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
+    task = await complete_batcher.submit(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
 
-        task.mark_complete()
-        session.add(task)
-        await session.commit()
-        await session.refresh(task)
-        return TaskResponse.model_validate(task, from_attributes=True)
-    except HTTPException:
-        raise
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error marking task complete: {str(e)}")
+    _invalidate_stats()
+    return _task_response(task)
 
 
 @router.patch("/tasks/{task_id}/incomplete", response_model=TaskResponse)
-async def mark_incomplete(task_id: int, session: AsyncSession = Depends(get_session)):
+async def mark_incomplete(task_id: int):
     """
     Mark a task as incomplete.
 
@@ -263,18 +338,9 @@ async def mark_incomplete(task_id: int, session: AsyncSession = Depends(get_sess
     Raises:
         404: If task not found
     """
-    try:
-        task = await session.get(Task, task_id)
-        if not task:
-            raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
+    task = await incomplete_batcher.submit(task_id)
+    if not task:
+        raise HTTPException(status_code=404, detail=f"Task with ID {task_id} not found")
 
-        task.mark_incomplete()
-        session.add(task)
-        await session.commit()
-        await session.refresh(task)
-        return TaskResponse.model_validate(task, from_attributes=True)
-    except HTTPException:
-        raise
-    except Exception as e:
-        await session.rollback()
-        raise HTTPException(status_code=500, detail=f"Error marking task incomplete: {str(e)}")
+    _invalidate_stats()
+    return _task_response(task)
@@ -4,7 +4,7 @@ Pydantic schemas for Task API validation.
 These models define the shape of request/response data for API endpoints.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import datetime
 
@@ -35,6 +35,8 @@ class TaskResponse(BaseModel):
 
     Represents a complete Task object returned by the API.
     """
+    model_config = ConfigDict(from_attributes=True)  # Allow creating from Task object using attribute names
+
     id: int = Field(..., description="Unique task identifier")
     title: str = Field(..., description="Task title")
     description: str = Field(..., description="Task description")
@@ -42,9 +44,6 @@ class TaskResponse(BaseModel):
     created_at: datetime = Field(..., description="Timestamp when task was created")
     completed_at: Optional[datetime] = Field(None, description="Timestamp when task was marked complete")
 
-    class Config:
-        from_attributes = True  # Allow creating from Task object using attribute names
-
 
 class TaskStats(BaseModel):
     """
@@ -3,8 +3,10 @@ Models package - Data structures and validation
 
 Exports:
   - Task: Data model for individual todo items
+  - STATUS_PENDING, STATUS_COMPLETE: Canonical task status strings
+  - validate_title: Title validation shared by Task and the API
 """
 
-from .task import Task
+from .task import STATUS_COMPLETE, STATUS_PENDING, Task, validate_title
 
-__all__ = ['Task']
+__all__ = ['Task', 'STATUS_PENDING', 'STATUS_COMPLETE', 'validate_title']
@@ -17,9 +17,40 @@ Example:
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
+from sqlalchemy import Index, text
+from sqlalchemy.orm import configure_mappers
 from sqlmodel import SQLModel, Field
 
+# Canonical status strings. Literals are interned, so comparing a status that
+# was set from these constants takes the identity fast path of str ==.
+STATUS_PENDING = "pending"
+STATUS_COMPLETE = "complete"
+STATUSES = {STATUS_PENDING: STATUS_PENDING, STATUS_COMPLETE: STATUS_COMPLETE}
+
+
+def validate_title(title: Optional[str]) -> str:
+    """
+    Validate a task title and strip surrounding whitespace.
+
+    Titles that are already clean are returned as-is, without allocating a
+    stripped copy.
+
+    Args:
+        title: Proposed task title
+
+    Returns:
+        str: The title without leading/trailing whitespace
+
+    Raises:
+        ValueError: If the title is None, empty, or whitespace-only
+    """
+    if not title or title.isspace():
+        raise ValueError("Task title cannot be empty")
+    if title[0].isspace() or title[-1].isspace():
+        return title.strip()
+    return title
+
 
 class Task(SQLModel, table=True):
     """
@@ -49,10 +80,17 @@ class Task(SQLModel, table=True):
         'pending'
     """
 
+    # Serves "WHERE status = ? ORDER BY created_at DESC" as a single index range
+    # scan with no sort step. Its leading column also covers plain status
+    # lookups, so status needs no index of its own.
+    __table_args__ = (
+        Index("ix_task_status_created_at", "status", text("created_at DESC")),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(min_length=1, max_length=200, index=True)
     description: str = Field(default="", max_length=1000)
-    status: str = Field(default="pending", index=True)  # "pending" or "complete"
+    status: str = Field(default=STATUS_PENDING)  # "pending" or "complete"
     created_at: datetime = Field(default_factory=datetime.utcnow)
     completed_at: Optional[datetime] = Field(default=None)
 
@@ -60,11 +98,89 @@ class Task(SQLModel, table=True):
         """SQLModel configuration."""
         from_attributes = True  # Allow creating from dict-like objects
 
+    def __init__(
+        self, title: Optional[str] = None, description: str = "", **data: Any
+    ) -> None:
+        """
+        Create a task, validating and stripping the title.
+
+        Accepts the title and description positionally, so the same class
+        serves the ORM, the API, and the in-memory TaskManager. Rows loaded
+        from the database bypass __init__ and are not re-validated.
+
+        Args:
+            title: Task title (required, stripped of surrounding whitespace)
+            description: Task description (default: "")
+            **data: Any other field, e.g. status or created_at
+
+        Raises:
+            ValueError: If the title is None, empty, or whitespace-only
+        """
+        super().__init__(title=validate_title(title), description=description, **data)
+
+    @classmethod
+    def from_storage(
+        cls,
+        id: int,
+        title: str,
+        description: str,
+        status: str,
+        created_at: Optional[datetime],
+        completed_at: Optional[datetime],
+    ) -> "Task":
+        """
+        Build a task from already-validated stored fields, skipping __init__.
+
+        This is the path SQLAlchemy takes for rows it loads: a bare mapped
+        instance whose fields are filled in directly, with no pydantic
+        validation or per-attribute change tracking. Callers must pass a
+        clean title and a canonical status.
+
+        Returns:
+            Task: The reconstructed task
+        """
+        if not cls.__mapper__.configured:
+            configure_mappers()
+        task = cls.__mapper__.class_manager.new_instance()
+        task.__dict__.update(
+            id=id,
+            title=title,
+            description=description,
+            status=status,
+            created_at=created_at,
+            completed_at=completed_at,
+        )
+        return task
+
+    def set_title(self, title: str) -> None:
+        """
+        Replace the title, validating and stripping it.
+
+        Does not modify status or timestamps.
+
+        Raises:
+            ValueError: If the title is None, empty, or whitespace-only
+
+        Example:
+            >>> task = Task("Buy groceries")
+            >>> task.set_title("  Buy milk ")
+            >>> task.title
+            'Buy milk'
+        """
+        self.title = validate_title(title)
+
+    def set_description(self, description: str) -> None:
+        """
+        Replace the description. Does not modify status or timestamps.
+        """
+        self.description = description
+
     def mark_complete(self) -> None:
         """
         Mark the task as complete and record completion timestamp.
 
-        Sets status to "complete" and records current UTC datetime.
+        Sets status to "complete" and records current UTC datetime. Does nothing
+        if the task is already complete, so the original completion time is kept.
 
         Example:
             >>> task = Task(title="Buy groceries")
@@ -74,14 +190,17 @@ class Task(SQLModel, table=True):
             >>> task.completed_at is not None
             True
         """
-        self.status = "complete"
+        if self.status == STATUS_COMPLETE and self.completed_at is not None:
+            return
+        self.status = STATUS_COMPLETE
         self.completed_at = datetime.utcnow()
 
     def mark_incomplete(self) -> None:
         """
         Mark the task as incomplete and clear completion timestamp.
 
-        Sets status to "pending" and clears completed_at.
+        Sets status to "pending" and clears completed_at. Does nothing if the
+        task is already pending.
 
         Example:
             >>> task = Task(title="Buy groceries")
@@ -92,7 +211,9 @@ class Task(SQLModel, table=True):
             >>> task.completed_at is None
             True
         """
-        self.status = "pending"
+        if self.status == STATUS_PENDING and self.completed_at is None:
+            return
+        self.status = STATUS_PENDING
         self.completed_at = None
 
     def is_complete(self) -> bool:
@@ -110,7 +231,7 @@ class Task(SQLModel, table=True):
             >>> task.is_complete()
             True
         """
-        return self.status == "complete"
+        return self.status == STATUS_COMPLETE
 
     def is_pending(self) -> bool:
         """
@@ -124,7 +245,7 @@ class Task(SQLModel, table=True):
             >>> task.is_pending()
             True
         """
-        return self.status == "pending"
+        return self.status == STATUS_PENDING
 
     def __str__(self) -> str:
         """
@@ -139,11 +260,11 @@ class Task(SQLModel, table=True):
             >>> str(task)  # doctest: +ELLIPSIS
             '[#1] Buy groceries (pending) - Created: ...'
         """
-        created_str = self.created_at.strftime("%Y-%m-%d %H:%M:%S")
+        created_str = self.created_at.isoformat(sep=" ", timespec="seconds")
         result = f"[#{self.id}] {self.title} ({self.status}) - Created: {created_str}"
 
         if self.is_complete() and self.completed_at:
-            completed_str = self.completed_at.strftime("%Y-%m-%d %H:%M:%S")
+            completed_str = self.completed_at.isoformat(sep=" ", timespec="seconds")
             result += f" - Completed: {completed_str}"
 
         return result
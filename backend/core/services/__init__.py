@@ -5,9 +5,13 @@ Exports:
   - TaskManager: In-memory task storage and CRUD operations
   - TaskFileManager: File persistence for tasks
   - TaskSerializer: Serialization utilities
+  - TaskSQLRepository: Database persistence for tasks
+  - AsyncBatcher: Coalesces concurrent async calls into batches
 """
 
+from .async_batcher import AsyncBatcher
 from .task_manager import TaskManager
 from .task_persistence import TaskFileManager, TaskSerializer
+from .task_repository import TaskSQLRepository
 
-__all__ = ['TaskManager', 'TaskFileManager', 'TaskSerializer']
+__all__ = ['AsyncBatcher', 'TaskManager', 'TaskFileManager', 'TaskSerializer', 'TaskSQLRepository']
@@ -0,0 +1,135 @@
+"""
+AsyncBatcher - Coalesce concurrent async calls into batched executions.
+
+Callers submit one item at a time and await its result. Items submitted
+within a short window (or until the batch is full) are handed to a single
+batch function together, so N concurrent writes can share one statement and
+one commit instead of paying N round-trips.
+
+Example:
+    >>> async def double_all(items):
+    ...     return [item * 2 for item in items]
+    >>> batcher = AsyncBatcher(double_all, max_batch_size=32, max_wait=0.005)
+    >>> await batcher.submit(21)  # doctest: +SKIP
+    42
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Set, Tuple, Type
+
+
+class AsyncBatcher:
+    """
+    Collects submitted items and runs them through a batch function.
+
+    A batch is flushed when it reaches max_batch_size items or max_wait
+    seconds after its first item was submitted, whichever comes first. There
+    is no long-lived worker task: the flush is scheduled on the running event
+    loop, which keeps the batcher usable in serverless runtimes.
+
+    Attributes:
+        run_batch: Async function taking a list of items and returning a list of
+            results in the same order. If it raises, every caller in the batch
+            receives the exception, unless it is one of split_on.
+        max_batch_size (int): Maximum number of items per batch.
+        max_wait (float): Seconds to wait for more items before flushing.
+        split_on (tuple): Exception types caused by a single bad item (e.g. a
+            constraint violation). A batch of several items failing with one
+            of these is retried one item at a time, so only the callers whose
+            item fails receive an exception.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 64,
+        max_wait: float = 0.005,
+        split_on: Tuple[Type[BaseException], ...] = (),
+    ) -> None:
+        """
+        Initialize a batcher around a batch function.
+
+        Args:
+            run_batch: Async function mapping a list of items to a list of results
+            max_batch_size: Flush as soon as this many items are pending
+            max_wait: Seconds to wait for further items before flushing
+            split_on: Per-item exception types that make a failed batch be
+                retried one item at a time (default: never split)
+        """
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.split_on = split_on
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The event loop only keeps weak references to tasks, so hold the
+        # running batches until they finish
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """
+        Add an item to the current batch and wait for its result.
+
+        Args:
+            item: The item to process
+
+        Returns:
+            The result produced for this item by run_batch
+
+        Raises:
+            Exception: Whatever run_batch raised for the batch containing this
+                item, or for this item alone if the batch was split
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Hand all pending items to a new batch execution."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Execute one batch and resolve its callers' futures."""
+        try:
+            try:
+                results = await self.run_batch([item for item, _ in batch])
+            except self.split_on:
+                if len(batch) == 1:
+                    raise
+                # One bad item fails the whole batch; retry each item alone
+                # so only its own caller sees the error. Other failures (e.g.
+                # the database being unreachable) go to every caller at once
+                # rather than being replayed item by item.
+                for entry in batch:
+                    await self._run([entry])
+                return
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except BaseException as e:
+            # Never leave a caller waiting, even if this task is cancelled
+            for _, future in batch:
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
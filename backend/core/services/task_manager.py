@@ -19,17 +19,25 @@ Example:
         1
 """
 
-from typing import Optional
+import logging
+import math
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
 
-from ..models.task import Task
-from .task_persistence import TaskFileManager
+from ..models.task import Task, validate_title
+from .task_persistence import TaskFileManager, TaskSerializer
+from .task_repository import TaskSQLRepository
+
+logger = logging.getLogger(__name__)
 
 
 class TaskManager:
     """
     Manages in-memory task storage with CRUD operations and queries.
 
-    The TaskManager maintains a list of Task objects and provides methods for:
+    The TaskManager maintains an ID-indexed collection of Task objects and provides methods for:
     - Creating new tasks with automatic unique ID assignment
     - Retrieving tasks by ID or filtering by status
     - Updating task properties
@@ -37,7 +45,11 @@ class TaskManager:
     - Querying task statistics
 
     Attributes:
-        tasks (list[Task]): Collection of all Task objects.
+        tasks (list[Task]): All Task objects in creation order (read-only property).
+        _tasks_by_id (dict[int, Task]): Primary storage keyed by task ID. Dicts keep
+            insertion order, so iteration order is creation order.
+        _pending_ids (set[int]): IDs of tasks with "pending" status.
+        _completed_ids (set[int]): IDs of tasks with "complete" status.
         _next_id (int): Counter for generating unique task IDs. Starts at 0, increments to 1 for first task.
 
     Properties:
@@ -57,18 +69,44 @@ class TaskManager:
         1
     """
 
-    def __init__(self, persistence_file: Optional[str] = None) -> None:
+    # Journal mode: rewrite the snapshot once the log holds at least this many
+    # events and at least twice as many events as there are tasks, so the
+    # rewrite costs O(1) amortized per change however many tasks exist
+    COMPACT_EVERY = 500
+
+    def __init__(
+        self,
+        persistence_file: Optional[str] = None,
+        repository: Optional[TaskSQLRepository] = None,
+        background_save: bool = False,
+        journal: bool = False,
+        save_delay: float = 0.0,
+    ) -> None:
         """
-        Initialize a new TaskManager with optional file persistence.
+        Initialize a new TaskManager with optional file or database persistence.
 
         Creates a task manager that can optionally load and save tasks to a JSON file.
         If persistence_file is provided and the file exists, tasks are loaded from the file.
         If the file doesn't exist, a new empty file is created.
-        If persistence_file is None, the manager operates in pure in-memory mode.
+        If repository is provided instead, tasks are loaded from the database and
+        each change is written as a single row; IDs are assigned by the database.
+        If neither is given, the manager operates in pure in-memory mode.
 
         Args:
             persistence_file: Optional path to JSON file for task persistence.
                             If None, operates in in-memory mode (no file I/O).
+            repository: Optional TaskSQLRepository for database persistence.
+                        Ignored if persistence_file is given.
+            background_save: If True, file writes run on a single background
+                        thread so mutations return without waiting on disk I/O.
+                        Call close() to wait for the last write.
+            journal: If True, each change is appended to <file>.log instead of
+                        rewriting the whole file; the snapshot is rewritten
+                        once the log outgrows the task list (see
+                        COMPACT_EVERY) or on compact().
+            save_delay: If > 0, wait until no change has been made for this
+                        many seconds, then save once. Call close() (or flush())
+                        before exiting to write any pending changes.
 
         Example:
             >>> # In-memory mode (no persistence)
@@ -80,31 +118,241 @@ class TaskManager:
             >>> manager = TaskManager(persistence_file="tasks.json")
             >>> # Tasks loaded from tasks.json if it exists
         """
+        self._file_manager = None
+        self._repository = None
         if persistence_file:
             self._file_manager = TaskFileManager(persistence_file)
-            self.tasks, self._next_id = self._file_manager.load_tasks()
+            tasks, self._next_id = self._file_manager.load_tasks()
+        elif repository:
+            self._repository = repository
+            tasks, self._next_id = repository.load_tasks()
         else:
-            self._file_manager = None
-            self.tasks = []
+            tasks = []
             self._next_id = 0
 
-    def _save_if_persistent(self) -> None:
+        self._dirty = False
+        self._batch_depth = 0
+        self._journal = bool(journal and self._file_manager)
+        self._events: list = []
+        self._log_events = self._file_manager.log_event_count if self._file_manager else 0
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending_save: Optional[Future] = None
+        self._save_delay = save_delay
+        self._save_timer: Optional[threading.Timer] = None
+        # Held by every mutator and by flush(), so a save_delay timer thread
+        # never snapshots while a change is half-applied. Reentrant because
+        # mutators flush while holding it.
+        self._flush_lock = threading.RLock()
+        if background_save and self._file_manager:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="task-persist"
+            )
+        self._tasks_by_id = {}
+        self._pending_ids = set()
+        self._completed_ids = set()
+        for task in tasks:
+            self._index_task(task)
+
+    @property
+    def tasks(self) -> list:
+        """All tasks in creation order."""
+        return list(self._tasks_by_id.values())
+
+    def _index_task(self, task: Task) -> None:
+        """Add a task to the ID index and file it under the set matching its status."""
+        self._tasks_by_id[task.id] = task
+        if task.is_complete():
+            self._pending_ids.discard(task.id)
+            self._completed_ids.add(task.id)
+        else:
+            self._completed_ids.discard(task.id)
+            self._pending_ids.add(task.id)
+
+    def _apply_change(self, task: Task, change: Callable[[Task], None]) -> None:
+        """
+        Apply change(task), saving it to the repository first if there is one.
+
+        With a repository the change is made on a copy and written; the task
+        itself is only updated once the write succeeds, so a failed write
+        leaves the manager matching the database.
+        """
+        if not self._repository:
+            change(task)
+            return
+        staged = Task.from_storage(*TaskSerializer.task_to_row(task))
+        change(staged)
+        self._repository.update_task(staged)
+        task.title = staged.title
+        task.description = staged.description
+        task.status = staged.status
+        task.completed_at = staged.completed_at
+
+    def _save_if_persistent(
+        self, task: Optional[Task] = None, deleted_id: Optional[int] = None
+    ) -> None:
         """
         Save tasks to file if persistence is enabled.
 
-        Called after each mutating operation to automatically save changes.
+        Called after each mutating operation with the task that changed (or
+        the ID that was deleted). Outside a batch() block the change is
+        written immediately, or save_delay seconds after the last change if
+        a delay is set; inside one it only marks the manager dirty and the
+        write happens once when the outermost block exits.
         If persistence is not enabled, this method does nothing.
-        On save errors, prints a warning but doesn't crash the application.
+
+        Args:
+            task: Task that was added or modified
+            deleted_id: ID of the task that was deleted
 
         Side Effects:
-            - Writes tasks to JSON file if persistence_file was provided in __init__
-            - Prints warning if save fails
+            - Marks the manager dirty and may call flush()
+            - In journal mode, queues a journal event for the change
+        """
+        if not self._file_manager:
+            return
+        if self._journal:
+            if deleted_id is not None:
+                event = {'op': 'delete', 'id': deleted_id}
+            else:
+                event = {'op': 'put', 'task': TaskSerializer.task_to_payload(task)}
+            event['next_id'] = self._next_id
+            self._events.append(event)
+        self._dirty = True
+        if self._batch_depth == 0:
+            if self._save_delay > 0:
+                self._schedule_flush()
+            else:
+                self.flush()
+
+    def _schedule_flush(self) -> None:
+        """(Re)start the quiet-period timer that flushes pending changes."""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(self._save_delay, self.flush)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def flush(self) -> None:
+        """
+        Write pending changes to the persistence file.
+
+        Does nothing when persistence is disabled or nothing changed since
+        the last save. In journal mode, queued events are appended to the
+        log until it outgrows the task list (see COMPACT_EVERY), at which
+        point the full snapshot is rewritten instead. With background_save,
+        the write is queued on the writer thread; a queued snapshot write
+        that hasn't started yet is replaced by a newer one. On save errors, logs a warning
+        but doesn't crash the application; the next flush rewrites the full
+        snapshot.
+
+        Side Effects:
+            - Writes (or queues a write of) tasks to the JSON file or journal
+            - Logs a warning if save fails
+        """
+        with self._flush_lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Body of flush(); the caller holds _flush_lock."""
+        if not (self._file_manager and self._dirty):
+            return
+        self._dirty = False
+        compact_at = max(self.COMPACT_EVERY, 2 * len(self._tasks_by_id))
+        if self._journal and self._log_events + len(self._events) < compact_at:
+            events, self._events = self._events, []
+            self._log_events += len(events)
+            self._submit(self._append, events)
+            return
+
+        # Snapshot the field values, not the Task objects, while holding
+        # _flush_lock: mutators hold it too, so the rows never include a
+        # half-applied change (e.g. status set but completed_at not yet) and
+        # the background writer never reads a Task that is still changing.
+        self._events = []
+        self._log_events = 0
+        task_to_row = TaskSerializer.task_to_row
+        rows = [task_to_row(task) for task in self._tasks_by_id.values()]
+        next_id = self._next_id
+        if self._writer and self._pending_save is not None:
+            self._pending_save.cancel()  # superseded by this snapshot
+        self._submit(self._write, rows, next_id)
+
+    def compact(self) -> None:
+        """
+        Rewrite the full snapshot now, folding in and removing the journal.
         """
         if self._file_manager:
-            try:
-                self._file_manager.save_tasks(self.tasks, self._next_id)
-            except Exception as e:
-                print(f"Warning: Could not save tasks: {e}")
+            with self._flush_lock:
+                self._dirty = True
+                self._log_events = math.inf
+                self._flush_locked()
+
+    def _submit(self, fn, *args) -> None:
+        """Run a write on the background writer if enabled, else inline."""
+        if self._writer:
+            self._pending_save = self._writer.submit(fn, *args)
+        else:
+            fn(*args)
+
+    def _write(self, rows: list, next_id: int) -> None:
+        """Save a snapshot to the file; on failure, force a snapshot next flush."""
+        try:
+            if self._file_manager.save_rows(rows, next_id):
+                return
+        except Exception as e:
+            logger.warning("Could not save tasks: %s", e)
+        with self._flush_lock:
+            self._dirty = True
+            self._log_events = math.inf
+
+    def _append(self, events: list) -> None:
+        """Append events to the journal; on failure, force a snapshot next flush."""
+        if not self._file_manager.append_events(events):
+            with self._flush_lock:
+                self._dirty = True
+                self._log_events = math.inf
+
+    def close(self) -> None:
+        """
+        Flush pending changes and wait for background writes to finish.
+
+        Safe to call more than once. After close(), further changes are
+        saved synchronously.
+        """
+        with self._flush_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._save_delay = 0.0
+            self._flush_locked()
+        if self._writer:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+            self._pending_save = None
+
+    @contextmanager
+    def batch(self) -> Iterator["TaskManager"]:
+        """
+        Group several operations into a single file write.
+
+        Mutations inside the block are kept in memory and saved once when
+        the outermost batch() exits, including when it exits with an
+        exception. Blocks may be nested.
+
+        Example:
+            >>> manager = TaskManager(persistence_file="tasks.json")
+            >>> with manager.batch():
+            ...     for title in ["A", "B", "C"]:
+            ...         manager.add_task(title)
+            >>> # tasks.json written once, with all three tasks
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
 
     # CRUD Operations
 
@@ -128,7 +376,7 @@ class TaskManager:
 
         Side Effects:
             - Increments the ID counter
-            - Appends task to the tasks list
+            - Adds task to the ID index and the pending set
 
         Example:
             >>> manager = TaskManager()
@@ -140,24 +388,28 @@ class TaskManager:
             2
             >>> manager.add_task("")  # Raises ValueError
         """
-        # Create Task object (may raise ValueError if invalid)
-        task = Task(title, description)
+        with self._flush_lock:
+            # Create Task object (may raise ValueError if invalid)
+            task = Task(title, description)
 
-        # Assign unique ID and add to list
-        self._next_id += 1
-        task.id = self._next_id
-        self.tasks.append(task)
+            # Assign unique ID and index it
+            if self._repository:
+                task.id = self._next_id = self._repository.add_task(task)
+            else:
+                self._next_id += 1
+                task.id = self._next_id
+            self._index_task(task)
 
-        # Save to file if persistence is enabled
-        self._save_if_persistent()
+            # Save to file if persistence is enabled
+            self._save_if_persistent(task)
 
-        return task
+            return task
 
     def get_task_by_id(self, task_id: int) -> Task:
         """
         Retrieve a task by its unique ID.
 
-        Searches the task list for a task matching the given ID and returns it.
+        Looks the task up in the ID index (constant time).
 
         Args:
             task_id (int): The unique ID of the task to retrieve.
@@ -176,10 +428,10 @@ class TaskManager:
             True
             >>> manager.get_task_by_id(999)  # Raises KeyError
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        raise KeyError(f"Task with ID {task_id} not found")
+        try:
+            return self._tasks_by_id[task_id]
+        except KeyError:
+            raise KeyError(f"Task with ID {task_id} not found") from None
 
     def update_task(
         self, task_id: int, title: str = None, description: str = None
@@ -207,6 +459,7 @@ class TaskManager:
             - Modifies task.title if title is provided and valid
             - Modifies task.description if description is provided
             - Does NOT modify status or timestamps
+            - Saves only if a value actually changed
 
         Example:
             >>> manager = TaskManager()
@@ -220,21 +473,33 @@ class TaskManager:
             >>> manager.get_task_by_id(1).description
             'New desc'
         """
-        # Get the task (raises KeyError if not found)
-        task = self.get_task_by_id(task_id)
+        with self._flush_lock:
+            # Get the task (raises KeyError if not found)
+            task = self.get_task_by_id(task_id)
 
-        # Update title if provided
-        if title is not None:
-            task.set_title(title)
+            # Keep only values that differ (the title is validated either way)
+            if title is not None:
+                title = validate_title(title)
+                if title == task.title:
+                    title = None
+            if description is not None and description == task.description:
+                description = None
 
-        # Update description if provided
-        if description is not None:
-            task.set_description(description)
+            # Nothing to write if the values were already current
+            if title is None and description is None:
+                return task
 
-        # Save to file if persistence is enabled
-        self._save_if_persistent()
+            def change(target: Task) -> None:
+                if title is not None:
+                    target.title = title
+                if description is not None:
+                    target.set_description(description)
 
-        return task
+            self._apply_change(task, change)
+            # Save to file if persistence is enabled
+            self._save_if_persistent(task)
+
+            return task
 
     def delete_task(self, task_id: int) -> bool:
         """
@@ -254,7 +519,7 @@ class TaskManager:
             KeyError: If no task with the given ID exists.
 
         Side Effects:
-            - Removes task from self.tasks
+            - Removes task from the ID index and status sets
             - Does NOT reset or reuse the ID
 
         Example:
@@ -270,16 +535,20 @@ class TaskManager:
             3
             >>> manager.delete_task(999)  # Raises KeyError
         """
-        # Find and remove the task
-        for i, task in enumerate(self.tasks):
-            if task.id == task_id:
-                self.tasks.pop(i)
-                # Save to file if persistence is enabled
-                self._save_if_persistent()
-                return True
+        with self._flush_lock:
+            if task_id not in self._tasks_by_id:
+                raise KeyError(f"Task with ID {task_id} not found")
+
+            # Delete the row first so a failed write leaves the task in place
+            if self._repository:
+                self._repository.delete_task(task_id)
+            del self._tasks_by_id[task_id]
+            self._pending_ids.discard(task_id)
+            self._completed_ids.discard(task_id)
 
-        # Task not found
-        raise KeyError(f"Task with ID {task_id} not found")
+            # Save to file if persistence is enabled
+            self._save_if_persistent(deleted_id=task_id)
+            return True
 
     # Status Management
 
@@ -302,6 +571,7 @@ class TaskManager:
         Side Effects:
             - Changes task.status to "complete"
             - Sets task.completed_at to current datetime
+            - No-op (and no file write) if the task is already complete
 
         Example:
             >>> manager = TaskManager()
@@ -312,11 +582,18 @@ class TaskManager:
             >>> task.status
             'complete'
         """
-        task = self.get_task_by_id(task_id)
-        task.mark_complete()
-        # Save to file if persistence is enabled
-        self._save_if_persistent()
-        return task
+        with self._flush_lock:
+            task = self.get_task_by_id(task_id)
+            if task.is_complete():
+                # Already complete: nothing changes, so skip the file rewrite. Still
+                # re-index, since the task may have been changed directly.
+                self._index_task(task)
+                return task
+            self._apply_change(task, Task.mark_complete)
+            self._index_task(task)
+            # Save to file if persistence is enabled
+            self._save_if_persistent(task)
+            return task
 
     def mark_task_incomplete(self, task_id: int) -> Task:
         """
@@ -337,6 +614,7 @@ class TaskManager:
         Side Effects:
             - Changes task.status to "pending"
             - Clears task.completed_at (set to None)
+            - No-op (and no file write) if the task is already pending
 
         Example:
             >>> manager = TaskManager()
@@ -346,11 +624,18 @@ class TaskManager:
             >>> task.status
             'pending'
         """
-        task = self.get_task_by_id(task_id)
-        task.mark_incomplete()
-        # Save to file if persistence is enabled
-        self._save_if_persistent()
-        return task
+        with self._flush_lock:
+            task = self.get_task_by_id(task_id)
+            if task.is_pending():
+                # Already pending: nothing changes, so skip the file rewrite. Still
+                # re-index, since the task may have been changed directly.
+                self._index_task(task)
+                return task
+            self._apply_change(task, Task.mark_incomplete)
+            self._index_task(task)
+            # Save to file if persistence is enabled
+            self._save_if_persistent(task)
+            return task
 
     # Query Operations
 
@@ -373,13 +658,15 @@ class TaskManager:
             >>> len(manager.get_all_tasks())
             2
         """
-        return self.tasks.copy()
+        return list(self._tasks_by_id.values())
 
     def get_pending_tasks(self) -> list:
         """
         Retrieve all tasks with pending status.
 
-        Returns a filtered list of tasks that have status "pending".
+        Returns a list of tasks that have status "pending", read from the
+        pending ID set. IDs increase monotonically, so sorting them restores
+        creation order without scanning the full task list.
 
         Returns:
             list[Task]: All pending tasks in creation order.
@@ -392,16 +679,17 @@ class TaskManager:
             >>> len(manager.get_pending_tasks())
             1
         """
-        return [task for task in self.tasks if task.is_pending()]
+        return [self._tasks_by_id[task_id] for task_id in sorted(self._pending_ids)]
 
     def get_completed_tasks(self) -> list:
         """
         Retrieve all tasks with complete status.
 
-        Returns a filtered list of tasks that have status "complete".
+        Returns a list of tasks that have status "complete", read from the
+        completed ID set.
 
         Returns:
-            list[Task]: All completed tasks.
+            list[Task]: All completed tasks in creation order.
 
         Example:
             >>> manager = TaskManager()
@@ -411,7 +699,45 @@ class TaskManager:
             >>> len(manager.get_completed_tasks())
             1
         """
-        return [task for task in self.tasks if task.is_complete()]
+        return [self._tasks_by_id[task_id] for task_id in sorted(self._completed_ids)]
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Iterate over all tasks in creation order without copying.
+
+        Use this instead of get_all_tasks() when the caller only loops over
+        the tasks once. Do not add or delete tasks while iterating.
+
+        Yields:
+            Task: Each task in creation order.
+
+        Example:
+            >>> manager = TaskManager()
+            >>> manager.add_task("Task 1")
+            >>> [task.title for task in manager.iter_tasks()]
+            ['Task 1']
+        """
+        return iter(self._tasks_by_id.values())
+
+    def iter_pending_tasks(self) -> Iterator[Task]:
+        """
+        Iterate over pending tasks in creation order without building a list.
+
+        Yields:
+            Task: Each pending task in creation order.
+        """
+        tasks_by_id = self._tasks_by_id
+        return (tasks_by_id[task_id] for task_id in sorted(self._pending_ids))
+
+    def iter_completed_tasks(self) -> Iterator[Task]:
+        """
+        Iterate over completed tasks in creation order without building a list.
+
+        Yields:
+            Task: Each completed task in creation order.
+        """
+        tasks_by_id = self._tasks_by_id
+        return (tasks_by_id[task_id] for task_id in sorted(self._completed_ids))
 
     # Count Operations
 
@@ -430,7 +756,7 @@ class TaskManager:
             >>> manager.count_tasks()
             1
         """
-        return len(self.tasks)
+        return len(self._tasks_by_id)
 
     def count_pending(self) -> int:
         """
@@ -449,7 +775,7 @@ class TaskManager:
             >>> manager.count_pending()
             1
         """
-        return len(self.get_pending_tasks())
+        return len(self._pending_ids)
 
     def count_completed(self) -> int:
         """
@@ -467,7 +793,7 @@ class TaskManager:
             >>> manager.count_completed()
             1
         """
-        return len(self.get_completed_tasks())
+        return len(self._completed_ids)
 
     # Utility Operations
 
@@ -486,10 +812,7 @@ class TaskManager:
             >>> manager.is_task_exists(999)
             False
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return True
-        return False
+        return task_id in self._tasks_by_id
 
     def is_empty(self) -> bool:
         """
@@ -506,4 +829,4 @@ class TaskManager:
             >>> manager.is_empty()
             False
         """
-        return len(self.tasks) == 0
+        return not self._tasks_by_id
@@ -0,0 +1,95 @@
+"""
+SQL repository for TaskManager persistence.
+
+This module provides TaskSQLRepository, a database-backed alternative to
+TaskFileManager. Instead of rewriting the whole JSON file after every change,
+each TaskManager mutation becomes a single-row INSERT, UPDATE, or DELETE
+against the Task table.
+
+Example:
+    Persisting a TaskManager to a database:
+        >>> from sqlalchemy import create_engine
+        >>> engine = create_engine("sqlite:///tasks.db")
+        >>> manager = TaskManager(repository=TaskSQLRepository(engine))
+        >>> task = manager.add_task("Buy groceries")  # one INSERT
+        >>> manager.mark_task_complete(task.id)  # one UPDATE
+"""
+
+from typing import List, Tuple
+
+from sqlalchemy import delete, insert, update
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, select
+
+from ..models.task import Task
+
+
+class TaskSQLRepository:
+    """
+    Stores TaskManager tasks in the Task table, one row per task.
+
+    Uses a synchronous engine because TaskManager's API is synchronous. IDs
+    are assigned by the database so tasks created here never collide with
+    tasks created through the API on the same table.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """
+        Initialize the repository and create the Task table if needed.
+
+        Args:
+            engine: Synchronous SQLAlchemy engine for the task database
+        """
+        self.engine = engine
+        SQLModel.metadata.create_all(engine, tables=[Task.__table__])
+
+    def load_tasks(self) -> Tuple[List[Task], int]:
+        """
+        Load all tasks from the database.
+
+        Returns:
+            Tuple of (list of Task objects in ID order, highest task ID or 0)
+        """
+        with Session(self.engine, expire_on_commit=False) as session:
+            tasks = list(session.exec(select(Task).order_by(Task.id)))
+            session.expunge_all()
+        return tasks, tasks[-1].id if tasks else 0
+
+    def add_task(self, task: Task) -> int:
+        """
+        Insert a new task row.
+
+        Args:
+            task: Task to insert; its id is ignored
+
+        Returns:
+            int: ID assigned by the database
+        """
+        with self.engine.begin() as conn:
+            return conn.execute(
+                insert(Task).values(task.model_dump(exclude={"id"})).returning(Task.id)
+            ).scalar_one()
+
+    def update_task(self, task: Task) -> None:
+        """
+        Write a task's current fields to its existing row.
+
+        Args:
+            task: Task whose row should be updated
+        """
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(Task)
+                .where(Task.id == task.id)
+                .values(task.model_dump(exclude={"id"}))
+            )
+
+    def delete_task(self, task_id: int) -> None:
+        """
+        Delete a task row.
+
+        Args:
+            task_id: ID of the task to delete
+        """
+        with self.engine.begin() as conn:
+            conn.execute(delete(Task).where(Task.id == task_id))
@@ -0,0 +1,105 @@
+"""
+Integration tests for the task API routes.
+
+Tests cover:
+- Marking tasks complete and incomplete through the batched PATCH endpoints
+- Mapping uncaught exceptions to error status codes
+
+The routes run against a temporary SQLite database instead of PostgreSQL.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'backend')
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import SQLModel
+
+from api.main import app
+from api.middleware import ErrorHandlerMiddleware
+from core.models.task import Task
+
+
+class TestStatusRoutes(unittest.TestCase):
+    """Tests for the complete/incomplete PATCH endpoints."""
+
+    def setUp(self):
+        """Point the routes at a new SQLite database holding one task."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        engine = create_engine(f"sqlite:///{db_path}")
+        SQLModel.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(Task.__table__.insert().values(title="Task", description=""))
+        engine.dispose()
+
+        self.async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        sessionmaker = async_sessionmaker(
+            self.async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+        patcher = patch("api.routes.tasks.get_sessionmaker", return_value=sessionmaker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(app)
+
+    def tearDown(self):
+        """Dispose the engine and clean up the temporary directory."""
+        asyncio.run(self.async_engine.dispose())
+        self.temp_dir.cleanup()
+
+    def test_repeated_complete_keeps_first_completed_at(self):
+        """Test a second PATCH .../complete doesn't move completed_at."""
+        first = self.client.patch("/api/tasks/1/complete")
+        second = self.client.patch("/api/tasks/1/complete")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertIsNotNone(first.json()['completed_at'])
+        self.assertEqual(second.json()['completed_at'], first.json()['completed_at'])
+
+    def test_incomplete_clears_completed_at(self):
+        """Test PATCH .../incomplete resets the task to pending."""
+        self.client.patch("/api/tasks/1/complete")
+        response = self.client.patch("/api/tasks/1/incomplete")
+
+        self.assertEqual(response.json()['status'], "pending")
+        self.assertIsNone(response.json()['completed_at'])
+
+
+
+class TestErrorHandlerMiddleware(unittest.TestCase):
+    """Tests for the status codes picked for uncaught exceptions."""
+
+    def request_raising(self, exc_factory):
+        """Send a GET to an app that raises the given exception."""
+        async def failing_app(scope, receive, send):
+            raise exc_factory()
+
+        client = TestClient(ErrorHandlerMiddleware(failing_app))
+        return client.get("/")
+
+    def test_value_error_is_bad_request(self):
+        """Test a plain ValueError (e.g. a blank title) maps to 400."""
+        response = self.request_raising(lambda: ValueError("Task title cannot be empty"))
+        self.assertEqual(response.status_code, 400)
+
+    def test_validation_error_is_server_error(self):
+        """Test a pydantic ValidationError maps to 500, not 400."""
+        response = self.request_raising(
+            lambda: ValidationError.from_exception_data("TaskResponse", [])
+        )
+        self.assertEqual(response.status_code, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,11 +7,15 @@ Tests cover:
 - Error recovery (corrupted files, missing files)
 - Backward compatibility (in-memory mode still works)
 - Complex workflows with persistence
+- Batched writes
+- Background and debounced writes
+- Journal (append-only log) mode
 """
 
 import json
 import os
 import tempfile
+import threading
 import unittest
 
 from src.models.task import Task
@@ -337,8 +341,9 @@ class TestComplexPersistenceWorkflows(unittest.TestCase):
         """Test persistence with large number of tasks."""
         # Session 1: Add many tasks
         mgr1 = TaskManager(persistence_file=self.file_path)
-        for i in range(50):
-            mgr1.add_task(f"Task {i+1}", f"Description for task {i+1}")
+        with mgr1.batch():  # one save for the whole loop
+            for i in range(50):
+                mgr1.add_task(f"Task {i+1}", f"Description for task {i+1}")
 
         self.assertEqual(mgr1.count_tasks(), 50)
 
@@ -347,8 +352,9 @@ class TestComplexPersistenceWorkflows(unittest.TestCase):
         self.assertEqual(mgr2.count_tasks(), 50)
 
         # Session 3: Mark some complete
-        for i in range(1, 26):
-            mgr2.mark_task_complete(i)
+        with mgr2.batch():
+            for i in range(1, 26):
+                mgr2.mark_task_complete(i)
         self.assertEqual(mgr2.count_completed(), 25)
 
         # Session 4: Verify counts
@@ -391,5 +397,168 @@ class TestComplexPersistenceWorkflows(unittest.TestCase):
         self.assertIn("🍅", task.description)
 
 
+class TestBatchedPersistence(unittest.TestCase):
+    """Tests for grouping several operations into one file write."""
+
+    def setUp(self):
+        """Create a temporary directory for each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'tasks.json')
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_batch_defers_write_until_exit(self):
+        """Test changes inside batch() are written when the block exits."""
+        manager = TaskManager(persistence_file=self.file_path)
+
+        with manager.batch():
+            manager.add_task("Task 1")
+            manager.add_task("Task 2")
+            with open(self.file_path, 'r') as f:
+                self.assertEqual(len(json.load(f)['tasks']), 0)
+
+        with open(self.file_path, 'r') as f:
+            data = json.load(f)
+
+        self.assertEqual(len(data['tasks']), 2)
+        self.assertEqual(data['next_id'], 2)
+
+    def test_nested_batch_writes_once_at_outermost_exit(self):
+        """Test nested batch() blocks only write when the outer one exits."""
+        manager = TaskManager(persistence_file=self.file_path)
+
+        with manager.batch():
+            with manager.batch():
+                manager.add_task("Task 1")
+            with open(self.file_path, 'r') as f:
+                self.assertEqual(len(json.load(f)['tasks']), 0)
+
+        manager2 = TaskManager(persistence_file=self.file_path)
+        self.assertEqual(manager2.count_tasks(), 1)
+
+    def test_background_save_written_after_close(self):
+        """Test background writes have all landed once close() returns."""
+        manager = TaskManager(persistence_file=self.file_path, background_save=True)
+        for i in range(20):
+            manager.add_task(f"Task {i}")
+        manager.mark_task_complete(5)
+        manager.close()
+
+        manager2 = TaskManager(persistence_file=self.file_path)
+        self.assertEqual(manager2.count_tasks(), 20)
+        self.assertEqual(manager2.count_completed(), 1)
+
+    def test_save_delay_defers_write_until_close(self):
+        """Test debounced saves are not written immediately but land on close()."""
+        manager = TaskManager(persistence_file=self.file_path, save_delay=60)
+        manager.add_task("Task 1")
+        manager.add_task("Task 2")
+
+        with open(self.file_path, 'r') as f:
+            self.assertEqual(len(json.load(f)['tasks']), 0)
+
+        manager.close()
+        with open(self.file_path, 'r') as f:
+            self.assertEqual(len(json.load(f)['tasks']), 2)
+
+    def test_save_delay_timer_flush_races_with_mutations(self):
+        """Test timer flushes running during mutations neither crash nor lose changes."""
+        errors = []
+        previous_hook = threading.excepthook
+        threading.excepthook = errors.append
+        try:
+            manager = TaskManager(persistence_file=self.file_path, save_delay=1e-5)
+            for i in range(10000):
+                manager.add_task(f"Task {i}")
+                if i % 7 == 0:
+                    manager.mark_task_complete(i + 1)
+            manager.close()
+        finally:
+            threading.excepthook = previous_hook
+
+        self.assertEqual(errors, [])
+        manager2 = TaskManager(persistence_file=self.file_path)
+        self.assertEqual(manager2.count_tasks(), 10000)
+        self.assertEqual(manager2.count_completed(), len(range(0, 10000, 7)))
+
+
+class TestJournalPersistence(unittest.TestCase):
+    """Tests for journal mode, where changes are appended to a log file."""
+
+    def setUp(self):
+        """Create a temporary directory for each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'tasks.json')
+        self.log_path = self.file_path + '.log'
+
+    def tearDown(self):
+        """Clean up temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_changes_appended_to_log(self):
+        """Test each change adds one journal line and leaves the snapshot alone."""
+        manager = TaskManager(persistence_file=self.file_path, journal=True)
+        manager.add_task("Task 1")
+        manager.add_task("Task 2")
+        manager.mark_task_complete(1)
+
+        with open(self.file_path, 'r') as f:
+            self.assertEqual(len(json.load(f)['tasks']), 0)
+        with open(self.log_path, 'r') as f:
+            self.assertEqual(len(f.read().splitlines()), 3)
+
+    def test_log_replayed_on_load(self):
+        """Test a new manager sees changes recorded only in the journal."""
+        manager = TaskManager(persistence_file=self.file_path, journal=True)
+        manager.add_task("Task 1")
+        manager.add_task("Task 2")
+        manager.update_task(2, title="Updated")
+        manager.delete_task(1)
+
+        manager2 = TaskManager(persistence_file=self.file_path)
+        tasks = manager2.get_all_tasks()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].title, "Updated")
+        self.assertEqual(manager2._next_id, 2)
+
+    def test_unchanged_update_writes_nothing(self):
+        """Test update_task with the current values doesn't add a journal line."""
+        manager = TaskManager(persistence_file=self.file_path, journal=True)
+        manager.add_task("Task 1", "Description")
+        manager.update_task(1, title="  Task 1 ", description="Description")
+
+        with open(self.log_path, 'r') as f:
+            self.assertEqual(len(f.read().splitlines()), 1)
+
+    def test_compact_folds_log_into_snapshot(self):
+        """Test compact() rewrites the snapshot and removes the journal."""
+        manager = TaskManager(persistence_file=self.file_path, journal=True)
+        manager.add_task("Task 1")
+        manager.compact()
+
+        self.assertFalse(os.path.exists(self.log_path))
+        with open(self.file_path, 'r') as f:
+            self.assertEqual(len(json.load(f)['tasks']), 1)
+
+    def test_log_compacted_once_it_outgrows_task_list(self):
+        """Test the snapshot is rewritten when the log reaches twice the task count."""
+        manager = TaskManager(persistence_file=self.file_path, journal=True)
+        manager.COMPACT_EVERY = 4
+        with manager.batch():
+            for i in range(3):
+                manager.add_task(f"Task {i}")
+        manager.mark_task_complete(1)
+        manager.mark_task_incomplete(1)
+        self.assertTrue(os.path.exists(self.log_path))
+
+        manager.mark_task_complete(1)  # 6 events, 3 tasks
+
+        self.assertFalse(os.path.exists(self.log_path))
+        with open(self.file_path, 'r') as f:
+            self.assertEqual(len(json.load(f)['tasks']), 3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,130 @@
+"""
+Unit tests for AsyncBatcher.
+
+Tests cover:
+- Flushing when a batch is full or the wait expires
+- Returning each caller its own result, in order
+- Isolating a failing item from the rest of its batch
+- Failing every caller when the batch errors or is cancelled
+"""
+
+import asyncio
+import unittest
+
+from src.services.async_batcher import AsyncBatcher
+
+
+class TestAsyncBatcher(unittest.IsolatedAsyncioTestCase):
+    """Tests for coalescing submitted items into batches."""
+
+    def setUp(self):
+        """Record every batch handed to the fake batch function."""
+        self.batches = []
+
+    async def double_all(self, items):
+        """Fake batch function: record the batch and double each item."""
+        self.batches.append(list(items))
+        return [item * 2 for item in items]
+
+    async def test_full_batch_flushes_immediately(self):
+        """Test reaching max_batch_size runs the batch without waiting."""
+        batcher = AsyncBatcher(self.double_all, max_batch_size=3, max_wait=60)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(i) for i in range(3))), timeout=1
+        )
+
+        self.assertEqual(results, [0, 2, 4])
+        self.assertEqual(self.batches, [[0, 1, 2]])
+
+    async def test_partial_batch_flushes_after_max_wait(self):
+        """Test items below max_batch_size are run together once max_wait passes."""
+        batcher = AsyncBatcher(self.double_all, max_batch_size=100, max_wait=0.001)
+
+        results = await asyncio.gather(batcher.submit(1), batcher.submit(2))
+
+        self.assertEqual(results, [2, 4])
+        self.assertEqual(self.batches, [[1, 2]])
+
+    async def test_results_follow_submission_order(self):
+        """Test each caller gets the result at its own position, including None."""
+        async def lookup(ids):
+            found = {2: "two", 3: "three"}
+            return [found.get(task_id) for task_id in ids]
+
+        batcher = AsyncBatcher(lookup, max_batch_size=3)
+        results = await asyncio.gather(*(batcher.submit(i) for i in (3, 1, 2)))
+
+        self.assertEqual(results, ["three", None, "two"])
+
+    async def test_split_on_error_fails_only_the_bad_item(self):
+        """Test a per-item error is retried item by item and reaches one caller."""
+        async def reject_three(items):
+            self.batches.append(list(items))
+            if 3 in items:
+                raise ValueError("bad item")
+            return [item * 2 for item in items]
+
+        batcher = AsyncBatcher(reject_three, max_batch_size=4, split_on=(ValueError,))
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(4)), return_exceptions=True
+        )
+
+        self.assertEqual(results[:3], [0, 2, 4])
+        self.assertIsInstance(results[3], ValueError)
+        self.assertEqual(self.batches, [[0, 1, 2, 3], [0], [1], [2], [3]])
+
+    async def test_other_errors_fail_the_whole_batch_without_retry(self):
+        """Test an error not in split_on goes to every caller, with no retries."""
+        async def unavailable(items):
+            self.batches.append(list(items))
+            raise ConnectionError("database unreachable")
+
+        batcher = AsyncBatcher(unavailable, max_batch_size=3, split_on=(ValueError,))
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(3)), return_exceptions=True
+        )
+
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+        self.assertEqual(len(self.batches), 1)
+
+    async def test_cancelled_batch_releases_callers(self):
+        """Test cancelling a running batch cancels its callers instead of hanging."""
+        started = asyncio.Event()
+
+        async def hang(items):
+            started.set()
+            await asyncio.Event().wait()
+
+        batcher = AsyncBatcher(hang, max_batch_size=2)
+        callers = asyncio.gather(
+            batcher.submit(1), batcher.submit(2), return_exceptions=True
+        )
+        await started.wait()
+        for task in list(batcher._tasks):
+            task.cancel()
+        results = await asyncio.wait_for(callers, timeout=1)
+
+        self.assertTrue(all(isinstance(r, asyncio.CancelledError) for r in results))
+
+    async def test_running_batch_is_referenced_until_done(self):
+        """Test the batcher holds the batch task while it runs and drops it after."""
+        release = asyncio.Event()
+
+        async def wait_for_release(items):
+            await release.wait()
+            return items
+
+        batcher = AsyncBatcher(wait_for_release, max_batch_size=1)
+        caller = asyncio.ensure_future(batcher.submit("item"))
+        await asyncio.sleep(0)
+        self.assertEqual(len(batcher._tasks), 1)
+
+        release.set()
+        self.assertEqual(await caller, "item")
+        await asyncio.sleep(0)
+        self.assertEqual(batcher._tasks, set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ Tests cover:
 - Data integrity and validation
 """
 
+import asyncio
 import json
 import os
 import tempfile
@@ -17,7 +18,12 @@ import unittest
 from datetime import datetime
 
 from src.models.task import Task
-from src.services.task_persistence import TaskFileManager, TaskSerializer
+from src.services.task_persistence import (
+    _SNAPSHOT_CACHE_SIZE,
+    TaskFileManager,
+    TaskSerializer,
+    _snapshot_cache,
+)
 
 
 class TestFileCreation(unittest.TestCase):
@@ -221,6 +227,62 @@ class TestLoadTasks(unittest.TestCase):
         self.assertEqual(len(tasks), 1)
         self.assertEqual(tasks[0].title, "Valid task")
 
+    def test_reload_of_unchanged_file_returns_fresh_tasks(self):
+        """Test reloading an unchanged file doesn't share Task objects."""
+        task = Task("Original")
+        task.id = 1
+        manager = TaskFileManager(self.file_path)
+        manager.save_tasks([task], 2)
+
+        first, _ = manager.load_tasks()
+        first[0].title = "Changed in memory"
+        second, next_id = manager.load_tasks()
+
+        self.assertIsNot(first[0], second[0])
+        self.assertEqual(second[0].title, "Original")
+        self.assertEqual(next_id, 2)
+
+    def test_reload_picks_up_external_rewrite(self):
+        """Test a file replaced by another writer is parsed again."""
+        task = Task("Original")
+        task.id = 1
+        manager = TaskFileManager(self.file_path)
+        manager.save_tasks([task], 2)
+        manager.load_tasks()
+
+        task.title = "Rewritten"
+        TaskFileManager(self.file_path).save_tasks([task], 2)
+        tasks, _ = manager.load_tasks()
+
+        self.assertEqual(tasks[0].title, "Rewritten")
+
+    def test_reload_picks_up_same_size_rewrite_in_place(self):
+        """Test a rewrite that keeps inode, size and mtime is still parsed again."""
+        task = Task("Original")
+        task.id = 1
+        manager = TaskFileManager(self.file_path)
+        manager.save_tasks([task], 2)
+        manager.load_tasks()
+
+        st = os.stat(self.file_path)
+        with open(self.file_path, 'r+b') as f:
+            raw = f.read().replace(b'Original', b'Replaced')
+            f.seek(0)
+            f.write(raw)
+        os.utime(self.file_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        tasks, _ = manager.load_tasks()
+
+        self.assertEqual(tasks[0].title, "Replaced")
+
+    def test_snapshot_cache_is_bounded(self):
+        """Test the snapshot cache keeps only the most recently used files."""
+        for i in range(10):
+            path = os.path.join(self.temp_dir.name, f'tasks{i}.json')
+            TaskFileManager(path).save_tasks([], 0)
+
+        self.assertLessEqual(len(_snapshot_cache), _SNAPSHOT_CACHE_SIZE)
+        self.assertIn(path, _snapshot_cache)
+
 
 class TestSaveTasks(unittest.TestCase):
     """Tests for saving tasks to JSON files."""
@@ -317,12 +379,26 @@ class TestSaveTasks(unittest.TestCase):
         self.assertEqual(len(data['tasks']), 1)
         self.assertEqual(data['tasks'][0]['title'], "Task 2")
 
+    def test_save_json_is_compact_by_default(self):
+        """Test that saved JSON has no indentation by default."""
+        task = Task("Buy groceries")
+        task.id = 1
+
+        manager = TaskFileManager(self.file_path, pretty=False)
+        manager.save_tasks([task], 2)
+
+        with open(self.file_path, 'r') as f:
+            content = f.read()
+
+        self.assertNotIn('\n', content)
+        self.assertEqual(json.loads(content)['tasks'][0]['title'], "Buy groceries")
+
     def test_save_json_is_pretty_printed(self):
-        """Test that saved JSON is human-readable (indented)."""
+        """Test that saved JSON is human-readable (indented) when pretty is set."""
         task = Task("Buy groceries")
         task.id = 1
 
-        manager = TaskFileManager(self.file_path)
+        manager = TaskFileManager(self.file_path, pretty=True)
         manager.save_tasks([task], 2)
 
         # Read and check formatting
@@ -364,6 +440,69 @@ class TestSaveTasks(unittest.TestCase):
         self.assertEqual(data['tasks'][0]['title'], "Buy 🛒 items")
         self.assertEqual(data['tasks'][0]['description'], "For Sunday's dinner: pasta & meat")
 
+    def test_save_tasks_async(self):
+        """Test the async save writes the same file as save_tasks."""
+        task = Task("Async task")
+        task.id = 1
+
+        manager = TaskFileManager(self.file_path)
+        result = asyncio.run(manager.save_tasks_async([task], 1))
+
+        self.assertTrue(result)
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['tasks'][0]['title'], "Async task")
+
+    def test_save_rows_uses_snapshot_values(self):
+        """Test save_rows writes the field values taken, not later changes."""
+        task = Task("Before")
+        task.id = 1
+        rows = [TaskSerializer.task_to_row(task)]
+        task.title = "After"
+
+        manager = TaskFileManager(self.file_path)
+        self.assertTrue(manager.save_rows(rows, 2))
+
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['tasks'][0]['title'], "Before")
+
+    def test_load_after_save_rows_matches_cold_read(self):
+        """Test reopening after save_rows gives what a fresh parse of the file gives."""
+        created = datetime(2024, 1, 1, 12, 0, 0)
+        rows = [
+            (1, "  Padded  ", "", "pending", created, None),
+            (2, "Bad status", "", "done", created, None),
+        ]
+        manager = TaskFileManager(self.file_path)
+        self.assertTrue(manager.save_rows(rows, 3))
+        warm, _ = TaskFileManager(self.file_path).load_tasks()
+
+        _snapshot_cache.clear()
+        cold, _ = TaskFileManager(self.file_path).load_tasks()
+
+        self.assertEqual(
+            [TaskSerializer.task_to_row(t) for t in warm],
+            [TaskSerializer.task_to_row(t) for t in cold],
+        )
+
+    def test_save_with_fsync_durability(self):
+        """Test durability='fsync' saves and loads like the default mode."""
+        task = Task("Durable task")
+        task.id = 1
+
+        manager = TaskFileManager(self.file_path, durability='fsync')
+        self.assertTrue(manager.save_tasks([task], 2))
+
+        tasks, next_id = TaskFileManager(self.file_path).load_tasks()
+        self.assertEqual(tasks[0].title, "Durable task")
+        self.assertEqual(next_id, 2)
+
+    def test_unknown_durability_raises(self):
+        """Test an unknown durability mode is rejected."""
+        with self.assertRaises(ValueError):
+            TaskFileManager(self.file_path, durability='sometimes')
+
 
 class TestErrorHandling(unittest.TestCase):
     """Tests for error handling in file operations."""
@@ -309,6 +309,22 @@ class TestTaskManagerStatusOperations(unittest.TestCase):
         with self.assertRaises(KeyError):
             self.manager.mark_task_incomplete(999)
 
+    def test_mark_methods_follow_directly_mutated_task(self):
+        """Test the mark methods go by the task's state, not the cached index."""
+        self.task.mark_complete()
+        self.manager.mark_task_complete(1)
+        self.assertEqual(self.manager.get_completed_tasks(), [self.task])
+        self.assertEqual(self.manager.get_pending_tasks(), [])
+
+    def test_mark_incomplete_after_direct_mark_complete(self):
+        """Test mark_task_incomplete reverts a task completed outside the manager."""
+        self.task.mark_complete()
+        self.manager.mark_task_incomplete(1)
+        self.assertTrue(self.task.is_pending())
+        self.assertIsNone(self.task.completed_at)
+        self.assertEqual(self.manager.get_pending_tasks(), [self.task])
+        self.assertEqual(self.manager.count_completed(), 0)
+
     def test_toggle_completion_multiple_times(self):
         """Test toggling completion status multiple times."""
         for i in range(5):
@@ -384,6 +400,37 @@ class TestTaskManagerQueryOperations(unittest.TestCase):
         self.assertEqual(self.manager.count_completed(), 3)
 
 
+class TestTaskManagerIterators(unittest.TestCase):
+    """Test the non-copying iterator variants of the query methods."""
+
+    def setUp(self):
+        """Create a manager with mixed task statuses."""
+        self.manager = TaskManager()
+        self.manager.add_task("Task 1")
+        self.manager.add_task("Task 2")
+        self.manager.add_task("Task 3")
+        self.manager.mark_task_complete(2)
+
+    def test_iter_tasks_matches_get_all_tasks(self):
+        """Test iter_tasks yields the same tasks as get_all_tasks."""
+        self.assertEqual(list(self.manager.iter_tasks()), self.manager.get_all_tasks())
+
+    def test_iter_pending_tasks(self):
+        """Test iter_pending_tasks yields pending tasks in creation order."""
+        self.assertEqual([t.id for t in self.manager.iter_pending_tasks()], [1, 3])
+
+    def test_iter_completed_tasks(self):
+        """Test iter_completed_tasks yields completed tasks."""
+        self.assertEqual([t.id for t in self.manager.iter_completed_tasks()], [2])
+
+    def test_tasks_property_returns_list_copy(self):
+        """Test the tasks property still returns a list the caller can change."""
+        tasks = self.manager.tasks
+        self.assertIsInstance(tasks, list)
+        tasks.clear()
+        self.assertEqual(self.manager.count_tasks(), 3)
+
+
 class TestTaskManagerUtilityOperations(unittest.TestCase):
     """Test utility methods."""
 
@@ -0,0 +1,134 @@
+"""
+Unit tests for the TaskSQLRepository persistence backend.
+
+Tests cover:
+- Loading from an empty database
+- Single-row add, update, and delete
+- TaskManager round-trips through the repository
+- TaskManager state left unchanged when a repository write fails
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+
+from src.services.task_manager import TaskManager
+from src.services.task_repository import TaskSQLRepository
+
+
+class TestTaskSQLRepository(unittest.TestCase):
+    """Tests for database-backed task persistence."""
+
+    def setUp(self):
+        """Create a SQLite database in a temporary directory for each test."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        self.engine = create_engine(f"sqlite:///{db_path}")
+        self.repository = TaskSQLRepository(self.engine)
+
+    def tearDown(self):
+        """Dispose the engine and clean up the temporary directory."""
+        self.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def test_load_empty_database(self):
+        """Test loading from a new database returns no tasks."""
+        tasks, next_id = self.repository.load_tasks()
+        self.assertEqual(tasks, [])
+        self.assertEqual(next_id, 0)
+
+    def test_manager_changes_survive_reload(self):
+        """Test add, update, complete, and delete are visible to a new manager."""
+        manager = TaskManager(repository=self.repository)
+        task1 = manager.add_task("Task 1")
+        task2 = manager.add_task("Task 2", "Description")
+        manager.update_task(task2.id, title="Updated")
+        manager.mark_task_complete(task2.id)
+        manager.delete_task(task1.id)
+
+        manager2 = TaskManager(repository=TaskSQLRepository(self.engine))
+        tasks = manager2.get_all_tasks()
+
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].id, task2.id)
+        self.assertEqual(tasks[0].title, "Updated")
+        self.assertTrue(tasks[0].is_complete())
+        self.assertIsNotNone(tasks[0].completed_at)
+
+    def test_ids_assigned_by_database(self):
+        """Test task IDs come from the database and are unique."""
+        manager = TaskManager(repository=self.repository)
+        task1 = manager.add_task("Task 1")
+        task2 = manager.add_task("Task 2")
+        self.assertIsNotNone(task1.id)
+        self.assertNotEqual(task1.id, task2.id)
+
+
+class TestFailingRepository(unittest.TestCase):
+    """Tests that a failed repository write leaves the manager unchanged."""
+
+    def setUp(self):
+        """Create a manager over a SQLite database holding one pending task."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        self.engine = create_engine(f"sqlite:///{db_path}")
+        self.repository = TaskSQLRepository(self.engine)
+        self.manager = TaskManager(repository=self.repository)
+        self.task = self.manager.add_task("Task", "Description")
+        self.error = OperationalError("statement", {}, Exception("database unavailable"))
+
+    def tearDown(self):
+        """Dispose the engine and clean up the temporary directory."""
+        self.engine.dispose()
+        self.temp_dir.cleanup()
+
+    def failing(self, method):
+        """Make the given repository method raise a database error."""
+        return patch.object(self.repository, method, side_effect=self.error)
+
+    def test_failed_add_keeps_no_task(self):
+        """Test a task the database never stored is not kept in memory."""
+        with self.failing('add_task'), self.assertRaises(OperationalError):
+            self.manager.add_task("Not stored")
+        self.assertEqual(self.manager.count_tasks(), 1)
+
+    def test_failed_update_keeps_old_values(self):
+        """Test a failed update leaves the title and description as they were."""
+        with self.failing('update_task'), self.assertRaises(OperationalError):
+            self.manager.update_task(self.task.id, title="New", description="New")
+        self.assertEqual(self.task.title, "Task")
+        self.assertEqual(self.task.description, "Description")
+
+    def test_failed_mark_complete_keeps_task_pending(self):
+        """Test a failed status write leaves the task and the status sets pending."""
+        with self.failing('update_task'), self.assertRaises(OperationalError):
+            self.manager.mark_task_complete(self.task.id)
+        self.assertTrue(self.task.is_pending())
+        self.assertIsNone(self.task.completed_at)
+        self.assertEqual(self.manager.get_pending_tasks(), [self.task])
+        self.assertEqual(self.manager.count_completed(), 0)
+
+    def test_failed_delete_keeps_task(self):
+        """Test a task whose row could not be deleted stays in the manager."""
+        with self.failing('delete_task'), self.assertRaises(OperationalError):
+            self.manager.delete_task(self.task.id)
+        self.assertEqual(self.manager.get_task_by_id(self.task.id), self.task)
+        self.assertEqual(self.manager.count_pending(), 1)
+
+    def test_successful_update_reaches_database(self):
+        """Test changes made through the staged copy are written and applied."""
+        self.manager.update_task(self.task.id, title="Updated")
+        self.manager.mark_task_complete(self.task.id)
+
+        tasks, _ = TaskSQLRepository(self.engine).load_tasks()
+        self.assertEqual(tasks[0].title, "Updated")
+        self.assertEqual(tasks[0].completed_at, self.task.completed_at)
+        self.assertTrue(self.task.is_complete())
+
+
+if __name__ == "__main__":
+    unittest.main()